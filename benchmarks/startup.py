@@ -0,0 +1,67 @@
+"""Measure CLI start-up time for quick invocations.
+
+Each scenario runs in a fresh interpreter so that module import costs are
+included. Usage::
+
+    python benchmarks/startup.py --config config/default.yaml --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SCENARIOS = {
+    "cli --help": ["main.py", "--help"],
+    "import engine": [
+        "-c",
+        "import sys, oquantus.screening, oquantus.snapshot; "
+        "assert 'pandas' not in sys.modules, 'pandas imported eagerly'",
+    ],
+    "resolve config (no cache)": [
+        "-c",
+        "from pathlib import Path; from oquantus.config import load_config; "
+        "p = Path({config!r}); load_config(p).all_symbols(p.parent)",
+    ],
+    "resolve config (snapshot)": [
+        "-c",
+        "from pathlib import Path; from oquantus.snapshot import load_snapshot; "
+        "load_snapshot(Path({config!r})).all_symbols()",
+    ],
+}
+
+
+def run(args: list[str], repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", type=Path, default=Path("config/default.yaml"))
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    config = str((ROOT / args.config).resolve())
+    # Warm the snapshot so the cached scenario measures a hit, not a rebuild.
+    run(["-c", SCENARIOS["resolve config (snapshot)"][1].format(config=config)], 1)
+    for name, scenario in SCENARIOS.items():
+        scenario_args = [part.format(config=config) for part in scenario]
+        timings = run(scenario_args, args.repeat)
+        print(
+            f"{name:<28} median={statistics.median(timings) * 1000:7.1f} ms  "
+            f"min={min(timings) * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import argparse
-from datetime import date
+import sys
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Optional, Sequence
 
-from oquantus.config import AppConfig, load_config
+from oquantus.config import AppConfig, load_config, merge_symbols
+from oquantus.scheduler import SessionScheduler
 from oquantus.screening import ScreeningEngine
+from oquantus.snapshot import load_snapshot
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the daily stock screening workflow.")
     parser.add_argument(
         "--config",
@@ -29,27 +32,93 @@ def parse_args() -> argparse.Namespace:
         "--today",
         type=str,
         default=None,
-        help="Override today's date in YYYY-MM-DD format (useful for backfilling).",
+        help=(
+            "Override today's date in YYYY-MM-DD format (useful for backfilling; "
+            "combine with --force to re-screen sessions that were already processed)."
+        ),
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--market",
+        action="append",
+        default=None,
+        help="Only screen the given market (repeatable, e.g. --market hk).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Screen every market even if its latest session was already processed.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-read the configuration and universe files instead of using the cached snapshot.",
+    )
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
-    config: AppConfig = load_config(args.config)
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
     base_path = args.config.parent
-    engine = ScreeningEngine.from_config(config, base_path)
-    symbols = config.all_symbols(base_path)
-    if args.limit:
-        symbols = symbols[: args.limit]
-    today = date.fromisoformat(args.today) if args.today else date.today()
-    start_date, end_date = config.fetcher.period(today)
-    candidates = engine.screen(symbols, start_date, end_date)
-    for candidate in candidates:
-        print(candidate.symbol)
-        for result in candidate.results:
-            metadata = ", ".join(f"{k}={v:.2f}" for k, v in result.metadata.items())
-            print(f"  - {result.strategy}: score={result.score:.4f} ({metadata})")
+    if args.no_cache:
+        config: AppConfig = load_config(args.config)
+        universe = config.symbols_by_market(base_path)
+    else:
+        snapshot = load_snapshot(args.config)
+        config = snapshot.config
+        universe = snapshot.universe
+    if args.market:
+        unknown = sorted(set(args.market) - set(universe))
+        if unknown:
+            raise SystemExit(
+                f"error: unknown market(s) {', '.join(unknown)}; "
+                f"configured markets: {', '.join(universe)}"
+            )
+        universe = {market: symbols for market, symbols in universe.items() if market in args.market}
+    scheduler = SessionScheduler.from_config(config, base_path)
+    today = date.fromisoformat(args.today) if args.today else None
+    runs = scheduler.plan(universe, datetime.now(timezone.utc), today=today, force=args.force)
+
+    engine = None
+    seen: set[str] = set()
+    remaining = args.limit or None
+    for run in runs:
+        if not run.due:
+            print(
+                f"[{run.market}] no new session since {run.last_session}; "
+                f"next run after {run.next_run.isoformat(timespec='minutes')}",
+                file=sys.stderr,
+            )
+            continue
+        pending = [symbol for symbol in merge_symbols([run.symbols]) if symbol not in seen]
+        symbols = pending if remaining is None else pending[:remaining]
+        if remaining is not None:
+            remaining -= len(symbols)
+        seen.update(symbols)
+        if not symbols:
+            continue
+        # Only build the engine (and load the stock pool) once a market is due.
+        engine = engine or ScreeningEngine.from_config(config, base_path)
+        start_date, end_date = config.fetcher.period(run.session)
+        report = engine.screen_with_report(symbols, start_date, end_date)
+        # Only record the session once its bar was actually fetched; failed
+        # downloads or a late bar leave it pending for the next run. Partial
+        # runs (--limit) must not hide the session from the next run either.
+        if run.tracked:
+            reached = any(bar >= run.session for bar in report.last_bars.values())
+            if not reached:
+                print(
+                    f"[{run.market}] no bar for session {run.session} fetched yet; "
+                    "it will be retried on the next run",
+                    file=sys.stderr,
+                )
+            elif len(symbols) == len(pending):
+                scheduler.mark_done(run.market, run.session)
+                scheduler.save()
+        for candidate in report.candidates:
+            print(candidate.symbol)
+            for result in candidate.results:
+                metadata = ", ".join(f"{k}={v:.2f}" for k, v in result.metadata.items())
+                print(f"  - {result.strategy}: score={result.score:.4f} ({metadata})")
 
 
 if __name__ == "__main__":
@@ -3,7 +3,10 @@
 __all__ = [
     "config",
     "data",
+    "market_calendar",
+    "scheduler",
     "stock_pool",
     "strategies",
     "screening",
+    "snapshot",
 ]
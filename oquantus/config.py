@@ -3,11 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, timedelta
+from datetime import date, time, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
-
-import yaml
+from typing import Any, Dict, Iterable, List, Optional
 
 
 @dataclass
@@ -68,6 +66,37 @@ class FetcherConfig:
         return start_date, end_date
 
 
+@dataclass
+class CalendarConfig:
+    """Overrides for the trading calendar of one market."""
+
+    timezone: Optional[str] = None
+    close: Optional[time] = None
+    holidays: List[date] = field(default_factory=list)
+    holidays_until: Optional[int] = None
+
+
+@dataclass
+class ScheduleConfig:
+    """Configuration for per-market, session-aware screening runs."""
+
+    state_path: Path = Path("schedule_state.json")
+    settle_minutes: int = 30
+    calendars: Dict[str, CalendarConfig] = field(default_factory=dict)
+
+
+def _parse_close(value: object) -> Optional[time]:
+    if value is None:
+        return None
+    if isinstance(value, int):
+        # YAML 1.1 reads an unquoted ``16:00`` as the sexagesimal integer 960
+        # (minutes) and ``16:00:00`` as 57600 (seconds).
+        if value >= 24 * 60:
+            return time(value // 3600, value // 60 % 60, value % 60)
+        return time(value // 60, value % 60)
+    return time.fromisoformat(str(value))
+
+
 @dataclass
 class AppConfig:
     """Root configuration for the screening application."""
@@ -76,11 +105,16 @@ class AppConfig:
     fetcher: FetcherConfig
     strategies: List[StrategyConfig]
     stock_pool: StockPoolConfig
+    schedule: ScheduleConfig = field(default_factory=ScheduleConfig)
 
     @classmethod
     def load(cls, path: Path) -> "AppConfig":
-        with path.open("r", encoding="utf-8") as handle:
-            raw = yaml.safe_load(handle)
+        return cls.from_dict(read_raw_config(path))
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "AppConfig":
+        """Build the configuration from an already parsed YAML mapping."""
+
         universe_sources = [
             UniverseSource(
                 market=entry.get("market", key),
@@ -107,28 +141,64 @@ class AppConfig:
             lookback_days=fetcher_raw.get("lookback_days", 120),
             batch_size=fetcher_raw.get("batch_size", 20),
         )
+        schedule_raw = raw.get("schedule", {})
+        schedule = ScheduleConfig(
+            state_path=Path(schedule_raw.get("state_path", "schedule_state.json")),
+            settle_minutes=schedule_raw.get("settle_minutes", 30),
+            calendars={
+                market: CalendarConfig(
+                    timezone=entry.get("timezone"),
+                    close=_parse_close(entry.get("close")),
+                    holidays=[date.fromisoformat(str(day)) for day in entry.get("holidays", [])],
+                    holidays_until=entry.get("holidays_until"),
+                )
+                for market, entry in schedule_raw.get("calendars", {}).items()
+            },
+        )
         return cls(
             universe=universe_sources,
             fetcher=fetcher,
             strategies=strategies,
             stock_pool=stock_pool,
+            schedule=schedule,
         )
 
+    def symbols_by_market(self, base_path: Path) -> Dict[str, List[str]]:
+        """Load the universe grouped by market, in configuration order."""
+
+        by_market: Dict[str, List[str]] = {}
+        for source in self.universe:
+            by_market.setdefault(source.market, []).extend(source.load_symbols(base_path))
+        return by_market
+
     def all_symbols(self, base_path: Path) -> List[str]:
         """Aggregate symbols from all configured universe sources."""
 
-        symbols: List[str] = []
-        for source in self.universe:
-            symbols.extend(source.load_symbols(base_path))
-        # Deduplicate while preserving order
-        seen = set()
-        deduped = []
-        for symbol in symbols:
+        return merge_symbols(self.symbols_by_market(base_path).values())
+
+
+def merge_symbols(groups: Iterable[Iterable[str]]) -> List[str]:
+    """Flatten symbol groups, upper-casing and deduplicating while preserving order."""
+
+    seen = set()
+    deduped = []
+    for group in groups:
+        for symbol in group:
             sym = symbol.upper()
             if sym not in seen:
                 seen.add(sym)
                 deduped.append(sym)
-        return deduped
+    return deduped
+
+
+def read_raw_config(path: Path) -> Dict[str, Any]:
+    """Parse the YAML configuration file at *path* into a plain mapping."""
+
+    # PyYAML is comparatively slow to import; only pay for it when parsing.
+    import yaml
+
+    with path.open("r", encoding="utf-8") as handle:
+        return yaml.safe_load(handle) or {}
 
 
 def load_config(path: Path) -> AppConfig:
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from datetime import date
-from typing import Dict, Iterable, Optional
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Iterable, Optional
 
-import pandas as pd
-import requests
+if TYPE_CHECKING:
+    import pandas as pd
+    import requests
 
 
 class DataFetchError(RuntimeError):
@@ -35,15 +36,27 @@ class YahooFinanceFetcher(HistoricalDataFetcher):
 
     BASE_URL = "https://query1.finance.yahoo.com/v7/finance/chart/{symbol}"
 
-    def __init__(self, session: Optional[requests.Session] = None, pause: float = 0.5):
-        self.session = session or requests.Session()
+    def __init__(self, session: Optional["requests.Session"] = None, pause: float = 0.5):
+        self._session = session
         self.pause = pause
 
+    @property
+    def session(self) -> "requests.Session":
+        # ``requests`` is only imported once the first download is attempted.
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        return self._session
+
     def fetch(self, symbol: str, start: date, end: date) -> DailyK:
+        import pandas as pd
+
         params = {
             "interval": "1d",
             "period1": int(time.mktime(start.timetuple())),
-            "period2": int(time.mktime((end).timetuple())),
+            # ``period2`` is exclusive; include the bar of the *end* session.
+            "period2": int(time.mktime((end + timedelta(days=1)).timetuple())),
         }
         url = self.BASE_URL.format(symbol=symbol)
         response = self.session.get(url, params=params, timeout=10)
@@ -0,0 +1,135 @@
+"""Exchange trading calendars used to decide when a market has a new daily bar."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, FrozenSet, Iterable, Optional
+from zoneinfo import ZoneInfo
+
+
+def _dates(*values: str) -> FrozenSet[date]:
+    return frozenset(date.fromisoformat(value) for value in values)
+
+
+# Full-day exchange closures. Half-day sessions still produce a daily bar and
+# are therefore treated as regular sessions. Extra dates can be supplied via
+# ``schedule.calendars.<market>.holidays`` in the configuration; raise
+# ``holidays_until`` there once a later year has been added.
+HOLIDAYS_UNTIL = 2026
+
+HK_HOLIDAYS = _dates(
+    "2025-01-01", "2025-01-29", "2025-01-30", "2025-01-31", "2025-04-04",
+    "2025-04-18", "2025-04-21", "2025-05-01", "2025-05-05", "2025-07-01",
+    "2025-10-01", "2025-10-07", "2025-10-29", "2025-12-25", "2025-12-26",
+    "2026-01-01", "2026-02-17", "2026-02-18", "2026-02-19", "2026-04-03",
+    "2026-04-06", "2026-04-07", "2026-05-01", "2026-05-25", "2026-06-19",
+    "2026-07-01", "2026-10-01", "2026-10-19", "2026-12-25",
+)
+
+US_HOLIDAYS = _dates(
+    "2025-01-01", "2025-01-09", "2025-01-20", "2025-02-17", "2025-04-18",
+    "2025-05-26", "2025-06-19", "2025-07-04", "2025-09-01", "2025-11-27",
+    "2025-12-25",
+    "2026-01-01", "2026-01-19", "2026-02-16", "2026-04-03", "2026-05-25",
+    "2026-06-19", "2026-07-03", "2026-09-07", "2026-11-26", "2026-12-25",
+)
+
+
+@dataclass(frozen=True)
+class MarketCalendar:
+    """Trading days and daily close time of a single exchange."""
+
+    market: str
+    timezone: str
+    close: time
+    holidays: FrozenSet[date] = field(default_factory=frozenset)
+    settle_minutes: int = 30
+    # Last year for which ``holidays`` is complete; ``None`` if not tracked.
+    holidays_until: Optional[int] = None
+
+    @property
+    def tz(self) -> ZoneInfo:
+        return ZoneInfo(self.timezone)
+
+    def covers(self, day: date) -> bool:
+        """Whether the holiday table is known to be complete for *day*."""
+
+        return self.holidays_until is None or day.year <= self.holidays_until
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def session_ready_at(self, day: date) -> datetime:
+        """Moment after which the daily bar for *day* is expected to be available."""
+
+        closed = datetime.combine(day, self.close, tzinfo=self.tz)
+        return closed + timedelta(minutes=self.settle_minutes)
+
+    def session_on_or_before(self, day: date) -> date:
+        """Most recent trading day that is not later than *day*."""
+
+        while not self.is_trading_day(day):
+            day -= timedelta(days=1)
+        return day
+
+    def latest_session(self, now: datetime) -> date:
+        """Most recent session whose bar is available at the aware datetime *now*."""
+
+        today = now.astimezone(self.tz).date()
+        session = self.session_on_or_before(today)
+        if session == today and now < self.session_ready_at(today):
+            session = self.session_on_or_before(today - timedelta(days=1))
+        return session
+
+    def next_run(self, now: datetime) -> datetime:
+        """First moment after *now* at which a new session becomes available."""
+
+        day = now.astimezone(self.tz).date()
+        while not self.is_trading_day(day) or self.session_ready_at(day) <= now:
+            day += timedelta(days=1)
+        return self.session_ready_at(day)
+
+
+BUILTIN_CALENDARS: Dict[str, MarketCalendar] = {
+    "hk": MarketCalendar(
+        market="hk",
+        timezone="Asia/Hong_Kong",
+        close=time(16, 0),
+        holidays=HK_HOLIDAYS,
+        holidays_until=HOLIDAYS_UNTIL,
+    ),
+    "us": MarketCalendar(
+        market="us",
+        timezone="America/New_York",
+        close=time(16, 0),
+        holidays=US_HOLIDAYS,
+        holidays_until=HOLIDAYS_UNTIL,
+    ),
+}
+
+
+def get_calendar(
+    market: str,
+    timezone: Optional[str] = None,
+    close: Optional[time] = None,
+    holidays: Iterable[date] = (),
+    settle_minutes: int = 30,
+    holidays_until: Optional[int] = None,
+) -> MarketCalendar:
+    """Return the calendar for *market*, applying any configured overrides."""
+
+    builtin = BUILTIN_CALENDARS.get(market)
+    if builtin is None and (timezone is None or close is None):
+        raise ValueError(
+            f"No trading calendar for market {market!r}; "
+            f"configure schedule.calendars.{market}.timezone and .close"
+        )
+    return MarketCalendar(
+        market=market,
+        timezone=timezone or builtin.timezone,
+        close=close or builtin.close,
+        holidays=(builtin.holidays if builtin else frozenset()) | frozenset(holidays),
+        settle_minutes=settle_minutes,
+        holidays_until=holidays_until or (builtin.holidays_until if builtin else None),
+    )
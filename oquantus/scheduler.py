@@ -0,0 +1,185 @@
+"""Session-aware scheduling of per-market screening runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import AppConfig, CalendarConfig
+from .market_calendar import BUILTIN_CALENDARS, MarketCalendar, get_calendar
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MarketRun:
+    """The planned screening run for one market."""
+
+    market: str
+    session: date
+    symbols: List[str]
+    due: bool
+    next_run: Optional[datetime]
+    last_session: Optional[date] = None
+    tracked: bool = True
+
+
+def _read_state(path: Path, warn: bool) -> Dict[str, date]:
+    """Load the last screened session per market; unreadable state counts as empty."""
+
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            raw_state = json.load(handle)
+        return {str(market): date.fromisoformat(day) for market, day in raw_state.items()}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, TypeError, AttributeError):
+        if warn:
+            logger.warning(
+                "Ignoring unreadable schedule state %s; every market will be fetched", path
+            )
+        return {}
+
+
+@dataclass
+class SessionScheduler:
+    """Decide which markets have a new daily bar since their last screening run.
+
+    The last screened session per market is persisted in a small JSON file so
+    that cron-driven invocations skip fetching and evaluation for markets that
+    are closed for a holiday or have not closed yet for the day.
+    """
+
+    calendars: Dict[str, MarketCalendar]
+    state_path: Path
+    last_sessions: Dict[str, date] = field(default_factory=dict)
+    calendar_overrides: Dict[str, CalendarConfig] = field(default_factory=dict)
+    settle_minutes: int = 30
+
+    def __post_init__(self) -> None:
+        if self.state_path.exists():
+            self.last_sessions = _read_state(self.state_path, warn=True)
+
+    def plan(
+        self,
+        universe: Dict[str, List[str]],
+        now: datetime,
+        today: Optional[date] = None,
+        force: bool = False,
+    ) -> List[MarketRun]:
+        """Return one run per market in *universe*, flagging those that are due.
+
+        *now* must be timezone aware. When *today* is given (backfilling), the
+        session is the last trading day on or before it, but never later than
+        the latest session that has closed at *now*.
+        Markets without a trading calendar are always due and never recorded.
+        """
+
+        runs: List[MarketRun] = []
+        for market, symbols in universe.items():
+            calendar = self.calendar_for(market)
+            if calendar is None:
+                logger.warning(
+                    "[%s] no trading calendar configured; screening on every run "
+                    "(set schedule.calendars.%s.timezone and .close to enable skipping)",
+                    market,
+                    market,
+                )
+                runs.append(
+                    MarketRun(
+                        market=market,
+                        session=today or now.date(),
+                        symbols=symbols,
+                        due=True,
+                        next_run=None,
+                        tracked=False,
+                    )
+                )
+                continue
+            checked_day = today or now.astimezone(calendar.tz).date()
+            if not calendar.covers(checked_day):
+                logger.warning(
+                    "[%s] holiday table only covers up to %s; exchange holidays in %s "
+                    "are treated as trading days (extend schedule.calendars.%s.holidays "
+                    "and holidays_until)",
+                    market,
+                    calendar.holidays_until,
+                    checked_day.year,
+                    market,
+                )
+            session = calendar.latest_session(now)
+            if today is not None:
+                # Never pick a session whose bar is not final yet, even if
+                # *today* names it; otherwise an intraday bar gets recorded.
+                session = min(session, calendar.session_on_or_before(today))
+            last = self.last_sessions.get(market)
+            runs.append(
+                MarketRun(
+                    market=market,
+                    session=session,
+                    symbols=symbols,
+                    due=force or last is None or session > last,
+                    next_run=calendar.next_run(now),
+                    last_session=last,
+                )
+            )
+        return runs
+
+    def calendar_for(self, market: str) -> Optional[MarketCalendar]:
+        """Return the calendar of *market*, or ``None`` if none is known."""
+
+        if market not in self.calendars:
+            overrides = self.calendar_overrides.get(market) or CalendarConfig()
+            if market not in BUILTIN_CALENDARS and not (overrides.timezone and overrides.close):
+                return None
+            self.calendars[market] = get_calendar(
+                market,
+                timezone=overrides.timezone,
+                close=overrides.close,
+                holidays=overrides.holidays,
+                settle_minutes=self.settle_minutes,
+                holidays_until=overrides.holidays_until,
+            )
+        return self.calendars[market]
+
+    def mark_done(self, market: str, session: date) -> None:
+        last = self.last_sessions.get(market)
+        if last is None or session > last:
+            self.last_sessions[market] = session
+
+    def save(self) -> None:
+        # Merge with the file as it is now so that overlapping per-market runs
+        # (e.g. ``--market hk`` and ``--market us``) do not drop each other's
+        # updates, then replace it atomically.
+        merged = _read_state(self.state_path, warn=False)
+        for market, session in self.last_sessions.items():
+            merged[market] = max(merged.get(market, session), session)
+        self.last_sessions = merged
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        serializable = {market: day.isoformat() for market, day in merged.items()}
+        fd, tmp_name = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(serializable, handle, indent=2)
+            os.replace(tmp_name, self.state_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def from_config(cls, config: AppConfig, base_path: Path) -> "SessionScheduler":
+        # Calendars are built lazily in ``plan`` so that markets filtered out
+        # on the command line are never validated.
+        schedule = config.schedule
+        return cls(
+            calendars={},
+            state_path=base_path / schedule.state_path,
+            calendar_overrides=schedule.calendars,
+            settle_minutes=schedule.settle_minutes,
+        )
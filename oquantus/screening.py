@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 from .config import AppConfig
 from .data.fetchers import HistoricalDataFetcher
@@ -19,6 +19,21 @@ class ScreeningCandidate:
     results: List
 
 
+@dataclass
+class ScreeningReport:
+    """Candidates of a screening pass plus the last bar date of each fetched symbol."""
+
+    candidates: List[ScreeningCandidate]
+    last_bars: Dict[str, date]
+
+
+def _last_bar_date(history) -> Optional[date]:
+    if history.empty:
+        return None
+    last = history.index[-1]
+    return last.date() if hasattr(last, "date") else None
+
+
 class ScreeningEngine:
     """Coordinates data fetching, strategy execution and pool updates."""
 
@@ -35,7 +50,13 @@ class ScreeningEngine:
         self.stock_pool = stock_pool
 
     def screen(self, symbols: Iterable[str], start: date, end: date) -> List[ScreeningCandidate]:
+        return self.screen_with_report(symbols, start, end).candidates
+
+    def screen_with_report(self, symbols: Iterable[str], start: date, end: date) -> ScreeningReport:
+        """Like :meth:`screen`, but also report which symbols returned data."""
+
         candidates: List[ScreeningCandidate] = []
+        last_bars: Dict[str, date] = {}
         for symbol in symbols:
             try:
                 daily_k = self.fetcher.fetch(symbol, start, end)
@@ -43,6 +64,9 @@ class ScreeningEngine:
                 # Skip problematic symbols but continue processing others
                 continue
             history = daily_k.data
+            last_bar = _last_bar_date(history)
+            if last_bar is not None:
+                last_bars[symbol] = last_bar
             symbol_results = []
             for strategy in self.strategies:
                 result = strategy.evaluate(symbol, history)
@@ -52,7 +76,7 @@ class ScreeningEngine:
             if symbol_results:
                 candidates.append(ScreeningCandidate(symbol=symbol, results=symbol_results))
         self.stock_pool.save()
-        return candidates
+        return ScreeningReport(candidates=candidates, last_bars=last_bars)
 
     @classmethod
     def from_config(cls, config: AppConfig, base_path: Path) -> "ScreeningEngine":
@@ -0,0 +1,135 @@
+"""Cached snapshot of the resolved configuration and universe.
+
+Parsing YAML and re-reading every universe file dominates the start-up time of
+small CLI runs. The snapshot stores the parsed configuration together with the
+resolved symbol lists as JSON and is reused for as long as the modification
+time and size of the configuration file and every universe file it references
+are unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import AppConfig, merge_symbols, read_raw_config
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class ConfigSnapshot:
+    """A validated configuration plus its universe grouped by market."""
+
+    config: AppConfig
+    universe: Dict[str, List[str]]
+    from_cache: bool = False
+
+    def all_symbols(self) -> List[str]:
+        """Return the deduplicated universe, matching :meth:`AppConfig.all_symbols`."""
+
+        return merge_symbols(self.universe.values())
+
+
+def default_snapshot_path(config_path: Path) -> Path:
+    """Location of the snapshot belonging to *config_path*."""
+
+    return config_path.parent / ".oquantus_cache" / f"{config_path.stem}.snapshot.json"
+
+
+def load_snapshot(config_path: Path, cache_path: Optional[Path] = None) -> ConfigSnapshot:
+    """Return the snapshot for *config_path*, rebuilding it when any source changed."""
+
+    cache_path = cache_path or default_snapshot_path(config_path)
+    cached = _read_cache(config_path, cache_path)
+    if cached is not None:
+        return cached
+    snapshot, payload = _build(config_path)
+    _write_cache(cache_path, payload)
+    return snapshot
+
+
+def _fingerprint(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _universe_files(config: AppConfig, base_path: Path) -> List[Path]:
+    return [
+        (base_path / source.path).resolve()
+        for source in config.universe
+        if source.type == "file" and source.path
+    ]
+
+
+def _build(config_path: Path) -> tuple[ConfigSnapshot, Dict[str, Any]]:
+    base_path = config_path.parent
+    config_fingerprint = _fingerprint(config_path)
+    raw = read_raw_config(config_path)
+    config = AppConfig.from_dict(raw)
+    # Stat before reading, like the config file: an edit racing the read then
+    # leaves a stale fingerprint and forces a rebuild on the next load.
+    # Missing files are left to ``load_symbols`` to report.
+    files = {
+        str(path): _fingerprint(path)
+        for path in _universe_files(config, base_path)
+        if path.exists()
+    }
+    universe = config.symbols_by_market(base_path)
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "config_path": str(config_path.resolve()),
+        "config_fingerprint": config_fingerprint,
+        "files": files,
+        "raw": raw,
+        "universe": universe,
+    }
+    return ConfigSnapshot(config=config, universe=universe), payload
+
+
+def _read_cache(config_path: Path, cache_path: Path) -> Optional[ConfigSnapshot]:
+    try:
+        with cache_path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if payload.get("version") != SNAPSHOT_VERSION:
+            return None
+        if payload["config_path"] != str(config_path.resolve()):
+            return None
+        if payload["config_fingerprint"] != _fingerprint(config_path):
+            return None
+        for path, fingerprint in payload["files"].items():
+            if _fingerprint(Path(path)) != fingerprint:
+                return None
+        config = AppConfig.from_dict(payload["raw"])
+        universe = {
+            str(market): [str(symbol) for symbol in symbols]
+            for market, symbols in payload["universe"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing, stale or corrupt snapshots are simply rebuilt.
+        return None
+    if sorted(universe) != sorted({source.market for source in config.universe}):
+        return None
+    return ConfigSnapshot(config=config, universe=universe, from_cache=True)
+
+
+def _write_cache(cache_path: Path, payload: Dict[str, Any]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    except OSError:
+        # The snapshot is an optimisation only; a read-only tree still works.
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            # Dates such as calendar holidays are stored in ISO form and
+            # re-parsed by AppConfig.from_dict.
+            json.dump(payload, handle, ensure_ascii=False, default=str)
+        os.replace(tmp_name, cache_path)
+    except (OSError, TypeError, ValueError):
+        # e.g. YAML values without a JSON representation; skip caching.
+        Path(tmp_name).unlink(missing_ok=True)
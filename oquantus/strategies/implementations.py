@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-
-import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from .base import Strategy, StrategyResult
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 @dataclass
 class MovingAverageCrossoverStrategy(Strategy):
@@ -31,7 +33,7 @@ class MovingAverageCrossoverStrategy(Strategy):
         if short_ma.iloc[-2] > long_ma.iloc[-2]:
             return None
         avg_volume = volumes.tail(self.long_window).mean()
-        if np.isnan(avg_volume) or avg_volume < self.min_volume:
+        if math.isnan(avg_volume) or avg_volume < self.min_volume:
             return None
         slope = (short_ma.iloc[-1] / short_ma.iloc[-3]) - 1 if short_ma.iloc[-3] != 0 else 0
         score = float((short_ma.iloc[-1] / long_ma.iloc[-1]) - 1)
@@ -66,10 +68,10 @@ class RSIOversoldReboundStrategy(Strategy):
         losses = -delta.clip(upper=0)
         avg_gain = gains.rolling(self.period).mean()
         avg_loss = losses.rolling(self.period).mean()
-        rs = avg_gain / avg_loss.replace(0, np.nan)
+        rs = avg_gain / avg_loss.replace(0, math.nan)
         rsi = 100 - (100 / (1 + rs))
         latest_rsi = float(rsi.iloc[-1])
-        if np.isnan(latest_rsi) or latest_rsi > self.exit_threshold:
+        if math.isnan(latest_rsi) or latest_rsi > self.exit_threshold:
             return None
         min_rsi = float(rsi.tail(5).min())
         if min_rsi > self.oversold:
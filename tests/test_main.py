@@ -0,0 +1,124 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from main import main
+from oquantus.data.fetchers import DailyK, DataFetchError, YahooFinanceFetcher
+
+SESSION = date(2026, 10, 16)
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        """
+        universe:
+          hong_kong:
+            market: hk
+            type: inline
+            symbols: ["0005.HK", "0700.HK"]
+          united_states:
+            market: us
+            type: inline
+            symbols: ["AAPL"]
+        strategies: []
+        stock_pool:
+          path: pool.json
+        schedule:
+          state_path: state.json
+        """
+    )
+    return path
+
+
+def bars_until(last: date):
+    def fetch(self, symbol, start, end):
+        index = pd.date_range(end=pd.Timestamp(last), periods=3, freq="D")
+        data = pd.DataFrame({"close": [1.0, 1.0, 1.0], "volume": [1, 1, 1]}, index=index)
+        return DailyK(symbol=symbol, data=data)
+
+    return fetch
+
+
+def failing(self, symbol, start, end):
+    raise DataFetchError(f"Failed to download {symbol}")
+
+
+def run(config_file: Path, *extra: str) -> None:
+    main(["--config", str(config_file), "--today", SESSION.isoformat(), "--no-cache", *extra])
+
+
+def state_of(config_file: Path):
+    state = config_file.parent / "state.json"
+    return json.loads(state.read_text()) if state.exists() else None
+
+
+def test_session_recorded_once_bar_is_fetched(config_file, monkeypatch, capsys):
+    monkeypatch.setattr(YahooFinanceFetcher, "fetch", bars_until(SESSION))
+    run(config_file)
+    assert state_of(config_file) == {"hk": "2026-10-16", "us": "2026-10-16"}
+
+    monkeypatch.setattr(YahooFinanceFetcher, "fetch", failing)
+    run(config_file)
+    assert "no new session since 2026-10-16" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("fetch", [failing, bars_until(date(2026, 10, 15))])
+def test_session_not_recorded_without_its_bar(config_file, monkeypatch, capsys, fetch):
+    monkeypatch.setattr(YahooFinanceFetcher, "fetch", fetch)
+    run(config_file)
+    assert state_of(config_file) is None
+    assert "will be retried" in capsys.readouterr().err
+
+
+def test_partial_run_keeps_state(config_file, monkeypatch):
+    monkeypatch.setattr(YahooFinanceFetcher, "fetch", bars_until(SESSION))
+    run(config_file, "--limit", "1")
+    assert state_of(config_file) is None
+    run(config_file, "--limit", "2")
+    assert state_of(config_file) == {"hk": "2026-10-16"}
+
+
+def test_unknown_market_is_rejected(config_file, monkeypatch):
+    monkeypatch.setattr(YahooFinanceFetcher, "fetch", failing)
+    with pytest.raises(SystemExit, match="unknown market.*HK.*configured markets: hk, us"):
+        run(config_file, "--market", "HK")
+    assert not (config_file.parent / "pool.json").exists()
+
+
+def test_market_without_calendar_is_screened_without_state(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        """
+        universe:
+          hong_kong:
+            market: hk
+            type: inline
+            symbols: ["0700.HK"]
+          china:
+            market: cn
+            type: inline
+            symbols: ["600519.SS"]
+        strategies: []
+        stock_pool:
+          path: pool.json
+        schedule:
+          state_path: state.json
+        """
+    )
+    fetched = []
+
+    def fetch(self, symbol, start, end):
+        fetched.append(symbol)
+        return bars_until(SESSION)(self, symbol, start, end)
+
+    monkeypatch.setattr(YahooFinanceFetcher, "fetch", fetch)
+    run(config_file, "--market", "hk")
+    assert fetched == ["0700.HK"]
+    run(config_file)
+    assert fetched == ["0700.HK", "600519.SS"]
+    assert state_of(config_file) == {"hk": "2026-10-16"}
@@ -0,0 +1,182 @@
+import json
+from datetime import date, datetime, time, timezone
+from pathlib import Path
+
+from oquantus.config import AppConfig, CalendarConfig
+from oquantus.market_calendar import get_calendar
+from oquantus.scheduler import SessionScheduler
+
+UNIVERSE = {"hk": ["0700.HK"], "us": ["AAPL"]}
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_latest_session_respects_close_and_holidays():
+    us = get_calendar("us")
+    # 2026-07-03 (Fri) is a US holiday; before Thursday's close + settle the
+    # latest session is Wednesday.
+    assert us.latest_session(utc(2026, 7, 2, 20, 0)) == date(2026, 7, 1)
+    assert us.latest_session(utc(2026, 7, 2, 20, 31)) == date(2026, 7, 2)
+    assert us.latest_session(utc(2026, 7, 6, 12, 0)) == date(2026, 7, 2)
+    assert us.next_run(utc(2026, 7, 2, 21, 0)) == datetime(
+        2026, 7, 6, 16, 30, tzinfo=us.tz
+    )
+
+
+def test_scheduler_skips_market_without_new_session(tmp_path: Path):
+    state = tmp_path / "state.json"
+    calendars = {market: get_calendar(market) for market in UNIVERSE}
+    scheduler = SessionScheduler(calendars=calendars, state_path=state)
+
+    # Friday 2026-07-03 after the HK close: HK traded, US is closed.
+    now = utc(2026, 7, 3, 9, 0)
+    runs = {run.market: run for run in scheduler.plan(UNIVERSE, now)}
+    assert runs["hk"].due and runs["hk"].session == date(2026, 7, 3)
+    assert runs["us"].due and runs["us"].session == date(2026, 7, 2)
+    for run in runs.values():
+        scheduler.mark_done(run.market, run.session)
+    scheduler.save()
+
+    reloaded = SessionScheduler(calendars=calendars, state_path=state)
+    later = utc(2026, 7, 3, 22, 0)
+    runs = {run.market: run for run in reloaded.plan(UNIVERSE, later)}
+    assert not runs["hk"].due
+    assert not runs["us"].due
+    assert [run.market for run in reloaded.plan(UNIVERSE, later, force=True) if run.due] == [
+        "hk",
+        "us",
+    ]
+
+    monday = utc(2026, 7, 6, 21, 0)
+    assert all(run.due for run in reloaded.plan(UNIVERSE, monday))
+
+
+def test_schedule_config_overrides(tmp_path: Path):
+    config = AppConfig.from_dict(
+        {
+            "universe": {"sg": {"market": "sg", "type": "inline", "symbols": ["D05.SI"]}},
+            "stock_pool": {"path": "pool.json"},
+            "schedule": {
+                "state_path": "state.json",
+                "calendars": {
+                    "sg": {
+                        "timezone": "Asia/Singapore",
+                        "close": 1020,
+                        "holidays": ["2026-08-10"],
+                    }
+                },
+            },
+        }
+    )
+    scheduler = SessionScheduler.from_config(config, tmp_path)
+    calendar = scheduler.calendar_for("sg")
+    assert calendar.close == time(17, 0)
+    assert not calendar.is_trading_day(date(2026, 8, 10))
+    assert scheduler.state_path == tmp_path / "state.json"
+
+
+def test_schedule_close_accepts_yaml_sexagesimal_and_strings():
+    def close_of(value):
+        config = AppConfig.from_dict(
+            {
+                "universe": {},
+                "stock_pool": {"path": "pool.json"},
+                "schedule": {"calendars": {"hk": {"close": value}}},
+            }
+        )
+        return config.schedule.calendars["hk"].close
+
+    # Unquoted ``16:30`` and ``16:30:00`` as parsed by PyYAML.
+    assert close_of(990) == time(16, 30)
+    assert close_of(59400) == time(16, 30)
+    assert close_of("16:30") == time(16, 30)
+
+
+def test_market_without_calendar_is_always_due(tmp_path: Path, caplog):
+    config = AppConfig.from_dict(
+        {
+            "universe": {
+                "hk": {"market": "hk", "type": "inline", "symbols": ["0700.HK"]},
+                "cn": {"market": "cn", "type": "inline", "symbols": ["600519.SS"]},
+            },
+            "stock_pool": {"path": "pool.json"},
+        }
+    )
+    scheduler = SessionScheduler.from_config(config, tmp_path)
+    now = utc(2026, 10, 16, 9, 0)
+
+    # Filtering to hk never touches the cn calendar.
+    assert [run.market for run in scheduler.plan({"hk": ["0700.HK"]}, now)] == ["hk"]
+    assert "cn" not in scheduler.calendars
+
+    scheduler.mark_done("hk", date(2026, 10, 16))
+    runs = {run.market: run for run in scheduler.plan({"hk": [], "cn": []}, now)}
+    assert not runs["hk"].due
+    assert runs["cn"].due and not runs["cn"].tracked
+    assert runs["cn"].next_run is None
+    assert "[cn] no trading calendar configured" in caplog.text
+
+
+def test_today_override_never_picks_an_open_session(tmp_path: Path):
+    calendars = {market: get_calendar(market) for market in UNIVERSE}
+    scheduler = SessionScheduler(calendars=calendars, state_path=tmp_path / "state.json")
+
+    # 2026-10-20 10:00 HKT: HK is still trading and the US has not opened yet.
+    now = utc(2026, 10, 20, 2, 0)
+    runs = {run.market: run for run in scheduler.plan(UNIVERSE, now, today=date(2026, 10, 20))}
+    assert runs["hk"].session == date(2026, 10, 16)
+    assert runs["us"].session == date(2026, 10, 19)
+
+    # Backfilling an earlier date still uses that date.
+    runs = {run.market: run for run in scheduler.plan(UNIVERSE, now, today=date(2026, 10, 14))}
+    assert runs["hk"].session == runs["us"].session == date(2026, 10, 14)
+
+
+def test_corrupt_state_is_treated_as_empty(tmp_path: Path, caplog):
+    state = tmp_path / "state.json"
+    state.write_text('{"hk": "2026-10')
+    scheduler = SessionScheduler(calendars={"hk": get_calendar("hk")}, state_path=state)
+    assert scheduler.last_sessions == {}
+    assert "Ignoring unreadable schedule state" in caplog.text
+
+    scheduler.mark_done("hk", date(2026, 10, 16))
+    scheduler.save()
+    assert json.loads(state.read_text()) == {"hk": "2026-10-16"}
+    assert list(tmp_path.iterdir()) == [state]
+
+
+def test_overlapping_runs_merge_state(tmp_path: Path):
+    state = tmp_path / "state.json"
+    state.write_text('{"hk": "2026-10-15", "us": "2026-10-15"}')
+    calendars = {market: get_calendar(market) for market in UNIVERSE}
+    hk_run = SessionScheduler(calendars=calendars, state_path=state)
+    us_run = SessionScheduler(calendars=calendars, state_path=state)
+
+    hk_run.mark_done("hk", date(2026, 10, 16))
+    us_run.mark_done("us", date(2026, 10, 16))
+    hk_run.save()
+    us_run.save()
+    assert json.loads(state.read_text()) == {"hk": "2026-10-16", "us": "2026-10-16"}
+
+
+def test_warns_when_holiday_table_runs_out(tmp_path: Path, caplog):
+    scheduler = SessionScheduler(calendars={}, state_path=tmp_path / "state.json")
+    scheduler.plan({"us": []}, utc(2026, 12, 30, 22, 0))
+    assert "holiday table" not in caplog.text
+
+    scheduler.plan({"us": []}, utc(2027, 1, 4, 22, 0))
+    assert "[us] holiday table only covers up to 2026" in caplog.text
+
+    caplog.clear()
+    extended = SessionScheduler(
+        calendars={},
+        state_path=tmp_path / "state.json",
+        calendar_overrides={
+            "us": CalendarConfig(holidays=[date(2027, 1, 1)], holidays_until=2027)
+        },
+    )
+    runs = extended.plan({"us": []}, utc(2027, 1, 4, 12, 0))
+    assert runs[0].session == date(2026, 12, 31)
+    assert "holiday table" not in caplog.text
@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from oquantus.config import AppConfig
+from oquantus.snapshot import load_snapshot
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def write_config(tmp_path: Path) -> Path:
+    config_file = tmp_path / "config.yaml"
+    (tmp_path / "us.txt").write_text("AAPL\nmsft\n")
+    config_file.write_text(
+        """
+        universe:
+          us:
+            market: us
+            type: file
+            path: us.txt
+          hk:
+            market: hk
+            type: inline
+            symbols: ["0700.HK", "AAPL"]
+        strategies:
+          - name: test
+            type: moving_average_crossover
+        stock_pool:
+          path: pool.json
+        """
+    )
+    return config_file
+
+
+def test_snapshot_is_reused_until_universe_changes(tmp_path: Path):
+    config_file = write_config(tmp_path)
+    cache = tmp_path / "snapshot.json"
+
+    first = load_snapshot(config_file, cache)
+    assert not first.from_cache
+    assert first.all_symbols() == ["AAPL", "MSFT", "0700.HK"]
+    assert first.universe == {"us": ["AAPL", "msft"], "hk": ["0700.HK", "AAPL"]}
+
+    second = load_snapshot(config_file, cache)
+    assert second.from_cache
+    assert second.all_symbols() == first.all_symbols()
+    assert second.config.stock_pool.path == Path("pool.json")
+
+    universe_file = tmp_path / "us.txt"
+    universe_file.write_text("TSLA\n")
+    stat = universe_file.stat()
+    os.utime(universe_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = load_snapshot(config_file, cache)
+    assert not third.from_cache
+    assert third.all_symbols() == ["TSLA", "0700.HK", "AAPL"]
+
+
+def test_corrupt_snapshot_is_rebuilt(tmp_path: Path):
+    config_file = write_config(tmp_path)
+    cache = tmp_path / "snapshot.json"
+    cache.write_text("{not json")
+    snapshot = load_snapshot(config_file, cache)
+    assert not snapshot.from_cache
+    assert load_snapshot(config_file, cache).from_cache
+
+
+def test_engine_import_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, oquantus.screening, oquantus.snapshot; "
+        "print(sorted({'pandas', 'numpy', 'requests', 'yaml'} & set(sys.modules)))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "[]"
+
+
+def test_universe_edit_during_build_invalidates_snapshot(tmp_path: Path, monkeypatch):
+    config_file = write_config(tmp_path)
+    cache = tmp_path / "snapshot.json"
+    universe_file = tmp_path / "us.txt"
+    original = AppConfig.symbols_by_market
+
+    def racing_read(self, base_path):
+        universe = original(self, base_path)
+        universe_file.write_text("TSLA\nNVDA\n")
+        stat = universe_file.stat()
+        os.utime(universe_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        return universe
+
+    monkeypatch.setattr(AppConfig, "symbols_by_market", racing_read)
+    assert load_snapshot(config_file, cache).universe["us"] == ["AAPL", "msft"]
+    monkeypatch.setattr(AppConfig, "symbols_by_market", original)
+
+    rebuilt = load_snapshot(config_file, cache)
+    assert not rebuilt.from_cache
+    assert rebuilt.universe["us"] == ["TSLA", "NVDA"]